@@ -3,9 +3,10 @@ from pathlib import Path
 from datetime import datetime
 
 from config import PCBParams
+from gmsh_backend import BACKENDS
 from gmsh_generator import generate_geo
 from gui import PCBGmshGUI
-from utils import open_gmsh_with_file, run_gmsh, run_elmer_grid
+from utils import open_gmsh_with_file, run_elmer_grid
 
 
 def _add_param_arguments(parser: argparse.ArgumentParser) -> None:
@@ -43,6 +44,12 @@ def main(argv: list[str] | None = None) -> None:
         default="",
         help="Path to the ElmerGrid executable",
     )
+    parser.add_argument(
+        "--backend",
+        choices=sorted(BACKENDS),
+        default="subprocess",
+        help="Meshing backend: the gmsh executable or the Gmsh Python API",
+    )
     parser.add_argument("--gui", action="store_true", help="Launch GUI instead of CLI")
     _add_param_arguments(parser)
     args = parser.parse_args(argv)
@@ -59,7 +66,11 @@ def main(argv: list[str] | None = None) -> None:
     print(f"Gmsh script written to {output_path}")
     mesh_needed = args.mesh or args.elmergrid
     if mesh_needed:
-        mesh_path = run_gmsh(str(output_path), output_path.parent)
+        backend = BACKENDS[args.backend]()
+        try:
+            mesh_path = backend.mesh(params, output_path.with_suffix(".unv")).mesh_path
+        finally:
+            backend.close()
         if args.elmergrid:
             output = run_elmer_grid(str(mesh_path), args.elmer_exe or None)
             if output.strip():
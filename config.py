@@ -16,3 +16,9 @@ class PCBParams:
     cut_height: float = 1.0
     mesh_size_min: float = 0.05
     mesh_size_max: float = 2.0
+    trace_edge_size: float = 0.05
+    via_face_size: float = 0.05
+    cut_edge_size: float = 0.05
+    size_field_dist_min: float = 0.05
+    size_field_dist_max: float = 2.0
+    size_field_sampling: float = 200.0
@@ -0,0 +1,296 @@
+"""Pluggable meshing backends.
+
+``SubprocessBackend`` writes the ``.geo`` script from :func:`generate_geo` and
+runs the ``gmsh`` executable, exactly like the CLI and GUI always have.
+``GmshSession`` builds the same geometry through the Gmsh Python API in the
+current process and keeps the session initialised between jobs, and
+``GmshWorkerBackend`` hosts a ``GmshSession`` in a long-lived worker process
+so the OCC kernel is only loaded once per sweep.
+
+All backends expose ``mesh(params, output_path) -> MeshResult``.
+"""
+
+import importlib
+import multiprocessing
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Optional
+
+from config import PCBParams
+from gmsh_generator import generate_geo
+from layout import pcb_layout
+from size_fields import apply_size_fields
+from utils import run_gmsh
+
+
+@dataclass
+class MeshResult:
+    """Mesh written to ``mesh_path`` plus, when available, the raw arrays.
+
+    The array fields mirror ``gmsh.model.mesh.getNodes()`` and
+    ``gmsh.model.mesh.getElements()`` and are ``None`` for backends that only
+    produce files.
+    """
+
+    mesh_path: Path
+    node_tags: Any = None
+    node_coords: Any = None
+    element_types: Any = None
+    element_tags: Any = None
+    element_node_tags: Any = None
+
+
+def load_gmsh(module_name: str = "gmsh") -> Any:
+    """Import the Gmsh Python API, raising ``RuntimeError`` if it is unusable.
+
+    An installed wheel whose shared libraries cannot be loaded raises
+    ``OSError`` on import rather than ``ImportError``.
+    """
+    try:
+        return importlib.import_module(module_name)
+    except ImportError as exc:
+        raise RuntimeError(
+            "The Gmsh Python API is not installed (pip install gmsh)"
+        ) from exc
+    except OSError as exc:
+        raise RuntimeError(f"The Gmsh Python API could not be loaded: {exc}") from exc
+
+
+class SubprocessBackend:
+    """Write the ``.geo`` script next to ``output_path`` and run ``gmsh``."""
+
+    def __init__(self, gmsh_path: Optional[str] = None) -> None:
+        self.gmsh_path = gmsh_path
+
+    def mesh(self, params: PCBParams, output_path: Path) -> MeshResult:
+        output_path = Path(output_path)
+        geo_path = output_path.with_suffix(".geo")
+        geo_path.write_text(generate_geo(params))
+        mesh_path = run_gmsh(str(geo_path), str(output_path.parent), self.gmsh_path)
+        return MeshResult(mesh_path)
+
+    def close(self) -> None:
+        pass
+
+
+def build_geometry(gmsh: Any, params: PCBParams) -> None:
+    """Create the model described by :func:`generate_geo` through the API."""
+    occ = gmsh.model.occ
+
+    gmsh.option.setNumber("Geometry.OCCSewFaces", 1)
+    gmsh.option.setNumber("Geometry.OCCFixSmallEdges", 1)
+    gmsh.option.setNumber("Geometry.OCCFixSmallFaces", 1)
+    gmsh.option.setNumber("Geometry.OCCAutoFix", 1)
+    gmsh.option.setNumber("Geometry.Tolerance", 1e-8)
+
+    layout = pcb_layout(params)
+
+    # Ground plane minus the rectangular cut centred under the trace
+    occ.addBox(*layout.ground, 1)
+    occ.addBox(*layout.cut, 10)
+    ground, _ = occ.cut([(3, 1)], [(3, 10)])
+
+    # Main via, trace, bounding sphere and guard vias
+    occ.addBox(*layout.main_via, 2)
+    occ.addBox(*layout.trace, 3)
+    occ.addSphere(0, 0, 0, params.sphere_radius, 4)
+    for tag, box in zip((5, 6, 7, 8), layout.guard_vias):
+        occ.addBox(*box, tag)
+
+    # Dielectric fills the gap between ground and trace
+    occ.addBox(*layout.dielectric, 9)
+
+    # Boolean operations
+    vias_all, _ = occ.fuse([(3, 2)], [(3, 5), (3, 6), (3, 7), (3, 8)])
+    ground_vias, _ = occ.fuse(ground, vias_all)
+    trace = [(3, 3)]
+    dielectric, _ = occ.cut([(3, 9)], ground_vias + trace, removeTool=False)
+    air, _ = occ.cut([(3, 4)], ground_vias + trace + dielectric, removeTool=False)
+
+    # Equivalent of ``Coherence;`` that keeps track of the renumbered volumes
+    groups = [ground_vias, trace, dielectric, air]
+    objects = [dim_tag for group in groups for dim_tag in group]
+    _, out_map = occ.fragment(objects, [])
+    occ.synchronize()
+
+    fragments = iter(out_map)
+    volumes = []
+    for group in groups:
+        tags: list[int] = []
+        for _ in group:
+            for dim, tag in next(fragments):
+                if dim == 3 and tag not in tags:
+                    tags.append(tag)
+        volumes.append(tags)
+
+    model = gmsh.model
+    for tag, name, vol_tags in zip(
+        (1, 2, 3, 4), ("Ground and Vias", "Trace", "Dielectric", "Air"), volumes
+    ):
+        model.addPhysicalGroup(3, vol_tags, tag, name)
+
+    # Boundary surfaces are found geometrically: the ground bottom lies in
+    # z = 0 and the outer boundary of all volumes together is the sphere.
+    tol = 1e-6
+    x, y, _, dx, dy, _ = layout.ground
+    ground_bottom = [
+        tag
+        for _, tag in model.getEntitiesInBoundingBox(
+            x - tol, y - tol, -tol, x + dx + tol, y + dy + tol, tol, 2
+        )
+    ]
+    all_volumes = [(3, tag) for vol_tags in volumes for tag in vol_tags]
+    air_boundary = [
+        abs(tag) for _, tag in model.getBoundary(all_volumes, combined=True, oriented=False)
+    ]
+    if not ground_bottom or not air_boundary:
+        raise RuntimeError("Could not locate the ground bottom or air boundary surfaces")
+    model.addPhysicalGroup(2, ground_bottom, 11, "Ground Bottom")
+    model.addPhysicalGroup(2, air_boundary, 12, "Air Boundary")
+
+    apply_size_fields(gmsh, params)
+
+    gmsh.option.setNumber("Mesh.Algorithm", 6)
+    gmsh.option.setNumber("Mesh.Algorithm3D", 10)
+    gmsh.option.setNumber("Mesh.OptimizeNetgen", 1)
+    gmsh.option.setNumber("Mesh.Optimize", 1)
+    gmsh.option.setNumber("Mesh.CharacteristicLengthMax", params.mesh_size_max)
+    gmsh.option.setNumber("Mesh.CharacteristicLengthMin", params.mesh_size_min)
+
+
+class GmshSession:
+    """In-process Gmsh API backend that stays initialised between jobs.
+
+    ``gmsh`` defaults to the real module; pass any object with the same API
+    (for instance a fake in tests) to run without Gmsh installed.
+    """
+
+    def __init__(self, gmsh: Any = None) -> None:
+        self.gmsh = gmsh if gmsh is not None else load_gmsh()
+        self._initialized = False
+
+    def mesh(self, params: PCBParams, output_path: Path) -> MeshResult:
+        gmsh = self.gmsh
+        if not self._initialized:
+            gmsh.initialize(readConfigFiles=False)
+            gmsh.option.setNumber("General.Terminal", 0)
+            self._initialized = True
+        gmsh.clear()
+        gmsh.model.add(Path(output_path).stem)
+
+        build_geometry(gmsh, params)
+        gmsh.model.mesh.generate(3)
+
+        output_path = Path(output_path)
+        gmsh.write(str(output_path))
+        node_tags, node_coords, _ = gmsh.model.mesh.getNodes()
+        element_types, element_tags, element_node_tags = gmsh.model.mesh.getElements()
+        return MeshResult(
+            output_path,
+            node_tags,
+            node_coords,
+            element_types,
+            element_tags,
+            element_node_tags,
+        )
+
+    def close(self) -> None:
+        if self._initialized:
+            self.gmsh.finalize()
+            self._initialized = False
+
+
+def _worker_main(conn: Any, module_name: str) -> None:
+    """Serve ``(params, output_path)`` requests until ``None`` is received."""
+    session = None
+    try:
+        while True:
+            request = conn.recv()
+            if request is None:
+                break
+            params, output_path = request
+            try:
+                if session is None:
+                    session = GmshSession(load_gmsh(module_name))
+                result = session.mesh(PCBParams(**params), Path(output_path))
+            except Exception as exc:
+                conn.send((False, str(exc)))
+            else:
+                conn.send((True, result))
+    finally:
+        if session is not None:
+            session.close()
+        conn.close()
+
+
+class GmshWorkerBackend:
+    """Run a :class:`GmshSession` in a persistent worker process.
+
+    The worker starts on the first job and is reused until :meth:`close`.
+    ``module_name`` selects the module the worker imports in place of
+    ``gmsh``, which lets a fake API module stand in when Gmsh is absent.
+    """
+
+    def __init__(self, module_name: str = "gmsh") -> None:
+        self.module_name = module_name
+        self._process: Optional[multiprocessing.Process] = None
+        self._conn: Any = None
+
+    def _reap_worker(self) -> None:
+        """Join (or kill) the worker and close its connection."""
+        self._process.join(timeout=5)
+        if self._process.is_alive():
+            self._process.kill()
+            self._process.join()
+        self._conn.close()
+        self._process = None
+        self._conn = None
+
+    def _ensure_worker(self) -> None:
+        if self._process is not None:
+            if self._process.is_alive():
+                return
+            self._reap_worker()
+        parent_conn, child_conn = multiprocessing.Pipe()
+        self._process = multiprocessing.Process(
+            target=_worker_main, args=(child_conn, self.module_name), daemon=True
+        )
+        self._process.start()
+        child_conn.close()
+        self._conn = parent_conn
+
+    def mesh(self, params: PCBParams, output_path: Path) -> MeshResult:
+        self._ensure_worker()
+        try:
+            self._conn.send((asdict(params), str(output_path)))
+            ok, payload = self._conn.recv()
+        except (EOFError, OSError) as exc:
+            self._reap_worker()
+            raise RuntimeError("Gmsh worker process exited unexpectedly") from exc
+        if not ok:
+            raise RuntimeError(payload)
+        return payload
+
+    def close(self) -> None:
+        if self._process is None:
+            return
+        try:
+            self._conn.send(None)
+        except OSError:
+            pass
+        self._reap_worker()
+
+    def __enter__(self) -> "GmshWorkerBackend":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+
+# Backends selectable by name. ``gmsh-api`` runs in-process, which suits a
+# single job; ``gmsh-worker`` pays off when many jobs share one backend.
+BACKENDS = {
+    "subprocess": SubprocessBackend,
+    "gmsh-api": GmshSession,
+    "gmsh-worker": GmshWorkerBackend,
+}
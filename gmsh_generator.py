@@ -1,4 +1,10 @@
 from config import PCBParams
+from layout import Box, pcb_layout
+from size_fields import size_field_geo
+
+
+def _geo_box(box: Box) -> str:
+    return ", ".join(repr(float(v)) for v in box)
 
 
 def generate_geo(params: PCBParams) -> str:
@@ -10,12 +16,14 @@ def generate_geo(params: PCBParams) -> str:
     t_length = params.trace_length
     v_width = params.via_width
     v_depth = params.via_depth
-    gv_width = params.guard_via_width
     sph_rad = params.sphere_radius
     mesh_min = params.mesh_size_min
     mesh_max = params.mesh_size_max
-    cut_w = params.cut_width
-    cut_h = params.cut_height
+    layout = pcb_layout(params)
+    guard_vias = "\n".join(
+        f"Box({tag}) = {{ {_geo_box(box)} }};" for tag, box in zip((5, 6, 7, 8), layout.guard_vias)
+    )
+    size_fields = size_field_geo(params)
 
     template = f"""//******************************************************
 // PCB Model - Generated by PCB GMSH Generator
@@ -40,36 +48,21 @@ via_depth        = {v_depth};
 sphere_radius    = {sph_rad};
 
 z0_ground_bot    = 0.0;
-z1_ground_top    = z0_ground_bot + ground_thickness;
-z2_trace_bot     = z1_ground_top + separation;
-z3_trace_top     = z2_trace_bot + trace_thickness;
-via_z_bot        = z1_ground_top - 1e-5;
-via_z_top        = z3_trace_top;
-eps              = 1e-6;
+z1_ground_top    = {layout.z1_ground_top!r};
+z2_trace_bot     = {layout.z2_trace_bot!r};
+z3_trace_top     = {layout.z3_trace_top!r};
+via_z_bot        = {layout.via_z_bot!r};
+via_z_top        = {layout.via_z_top!r};
 
 //------------------------- 2) Create Geometry -------------------------//
+// Box coordinates come from layout.pcb_layout(), shared with the size field.
 // Ground plane (Box 1)
-Box(1) = {{
-  -ground_size/2, -ground_size/2, z0_ground_bot,
-   ground_size,    ground_size,    ground_thickness
-}};
+Box(1) = {{ {_geo_box(layout.ground)} }};
 
 // *** ADDED: rectangular cut only through the ground plane ***
 // We'll center it under the trace.
-cut_w = {cut_w};
-cut_h = {cut_h};
-x_cut_center = -5.0 + trace_length/2;
-y_cut_center = 0.0;
-
 // Create the cut box (Box 10)
-Box(10) = {{
-  x_cut_center - cut_w/2,
-  y_cut_center - cut_h/2,
-  z0_ground_bot,
-  cut_w,
-  cut_h,
-  ground_thickness
-}};
+Box(10) = {{ {_geo_box(layout.cut)} }};
 
 // Replace Volume(1) with a difference: ground minus the new cut
 cutRes[] = BooleanDifference{{ Volume{{1}}; Delete; }}{{ Volume{{10}}; Delete; }};
@@ -78,47 +71,21 @@ SetId{{ Volume{{cutRes[0]}} }} 1;
 // *** END ADDED LINES ***
 
 // Main via (Box 2)
-Box(2) = {{
-  4.8, -0.1, via_z_bot,
-  via_width, via_depth, (via_z_top - via_z_bot - eps)
-}};
+Box(2) = {{ {_geo_box(layout.main_via)} }};
 
 // Trace (Box 3)
-Box(3) = {{
-  -5.0, -trace_width/2, z2_trace_bot + eps,
-   trace_length, trace_width, trace_thickness - 2*eps
-}};
+Box(3) = {{ {_geo_box(layout.trace)} }};
 
 // Bounding sphere (Sphere 4)
 Sphere(4) = {{ 0, 0, 0, sphere_radius }};
 
 // Guard vias (Boxes 5 to 8)
-x1 = -5.0 + trace_length/3.0;
-x2 = -5.0 + 2.0*(trace_length/3.0);
-Box(5) = {{
-  x1, -0.4, via_z_bot,
-  {gv_width}, {gv_width}, (via_z_top - via_z_bot - eps)
-}};
-Box(6) = {{
-  x1,  0.2, via_z_bot,
-  {gv_width}, {gv_width}, (via_z_top - via_z_bot - eps)
-}};
-Box(7) = {{
-  x2, -0.4, via_z_bot,
-  {gv_width}, {gv_width}, (via_z_top - via_z_bot - eps)
-}};
-Box(8) = {{
-  x2,  0.2, via_z_bot,
-  {gv_width}, {gv_width}, (via_z_top - via_z_bot - eps)
-}};
+{guard_vias}
 
 // *** Added for dielectric ***
 // This box fills the entire XY footprint of the PCB,
 // from the top of the ground plane to the bottom of the trace.
-Box(9) = {{
-  -ground_size/2, -ground_size/2, z1_ground_top,
-   ground_size,    ground_size,   (z2_trace_bot - z1_ground_top)
-}};
+Box(9) = {{ {_geo_box(layout.dielectric)} }};
 
 //------------------------- 3) Boolean Operations -------------------------//
 // Step 1: Fuse all vias together into a single volume array
@@ -162,19 +129,8 @@ Physical Surface("Ground Bottom", 11) = {{5}}; // Bottom of ground plane
 Physical Surface("Air Boundary", 12) = {{6}}; // Outer surface of air volume
 
 //------------------------- 5) Mesh Settings -------------------------//
-Point(200) = {{ 0, 0, z1_ground_top, 0.05 }};
-Point(201) = {{ 4.8 + via_width/2, 0, via_z_bot, 0.05 }};
-Point(202) = {{ x1, 0, via_z_bot, 0.05 }};
-Point(203) = {{ x2, 0, via_z_bot, 0.05 }};
-Point(204) = {{ -5.0 + trace_length/2.0, 0, z2_trace_bot, 0.05 }};
-
-Field[1] = Distance;
-Field[1].PointsList = {{200, 201, 202, 203, 204}};
-Field[2] = MathEval;
-Field[2].F = "0.05 + 0.1 * F1";
-Field[3] = Min;
-Field[3].FieldsList = {{2}};
-Background Field = 3;
+// Refine near trace edges, via faces and ground cut edges
+{size_fields}
 
     Mesh.Algorithm = 6;
     Mesh.Algorithm3D = 10;
@@ -1,5 +1,6 @@
 import os
 import re
+from dataclasses import replace
 from datetime import datetime
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
@@ -170,7 +171,8 @@ class PCBGmshGUI:
             save_last_elmer_path(path)
 
     def _collect_params(self) -> PCBParams:
-        return PCBParams(
+        return replace(
+            self.params,
             ground_size=self._vars["ground_size"].get(),
             ground_thickness=self._vars["ground_thickness"].get(),
             separation=self._vars["separation"].get(),
@@ -0,0 +1,83 @@
+"""Derived PCB coordinates shared by every geometry builder.
+
+``generate_geo``, the Gmsh API backend and the size-field builder all place
+the same boxes; they read them from :func:`pcb_layout` so the bounding boxes
+used to pick entities for mesh refinement always match the geometry.
+"""
+
+from dataclasses import dataclass
+
+from config import PCBParams
+
+# x, y, z, dx, dy, dz
+Box = tuple[float, float, float, float, float, float]
+
+TRACE_X_START = -5.0
+MAIN_VIA_XY = (4.8, -0.1)
+GUARD_VIA_Y = (-0.4, 0.2)
+# Vias start slightly inside the ground plane so the union is watertight.
+VIA_OVERLAP = 1e-5
+EPS = 1e-6
+
+
+@dataclass
+class PCBLayout:
+    z1_ground_top: float
+    z2_trace_bot: float
+    z3_trace_top: float
+    via_z_bot: float
+    via_z_top: float
+    ground: Box
+    cut: Box
+    main_via: Box
+    trace: Box
+    guard_vias: list[Box]
+    dielectric: Box
+
+
+def pcb_layout(params: PCBParams) -> PCBLayout:
+    """Return the position and size of every box making up the PCB."""
+    g_size = params.ground_size
+    z1_ground_top = params.ground_thickness
+    z2_trace_bot = z1_ground_top + params.separation
+    z3_trace_top = z2_trace_bot + params.trace_thickness
+    via_z_bot = z1_ground_top - VIA_OVERLAP
+    via_z_top = z3_trace_top
+    via_height = via_z_top - via_z_bot - EPS
+
+    x_cut_center = TRACE_X_START + params.trace_length / 2
+    gv_width = params.guard_via_width
+    x1 = TRACE_X_START + params.trace_length / 3.0
+    x2 = TRACE_X_START + 2.0 * (params.trace_length / 3.0)
+
+    return PCBLayout(
+        z1_ground_top=z1_ground_top,
+        z2_trace_bot=z2_trace_bot,
+        z3_trace_top=z3_trace_top,
+        via_z_bot=via_z_bot,
+        via_z_top=via_z_top,
+        ground=(-g_size / 2, -g_size / 2, 0.0, g_size, g_size, params.ground_thickness),
+        cut=(
+            x_cut_center - params.cut_width / 2,
+            -params.cut_height / 2,
+            0.0,
+            params.cut_width,
+            params.cut_height,
+            params.ground_thickness,
+        ),
+        main_via=(*MAIN_VIA_XY, via_z_bot, params.via_width, params.via_depth, via_height),
+        trace=(
+            TRACE_X_START,
+            -params.trace_width / 2,
+            z2_trace_bot + EPS,
+            params.trace_length,
+            params.trace_width,
+            params.trace_thickness - 2 * EPS,
+        ),
+        guard_vias=[
+            (x, y, via_z_bot, gv_width, gv_width, via_height)
+            for x in (x1, x2)
+            for y in GUARD_VIA_Y
+        ],
+        dielectric=(-g_size / 2, -g_size / 2, z1_ground_top, g_size, g_size, z2_trace_bot - z1_ground_top),
+    )
@@ -0,0 +1,130 @@
+"""Geometry-aware mesh size fields.
+
+Each refinement target is a set of model entities (trace edge curves, via
+faces, cut edges) selected by bounding box, because entity tags are only known
+after the boolean operations. Every target gets a ``Distance`` field feeding a
+``Threshold`` field; the minimum of all thresholds is the background field.
+The same description is rendered into ``.geo`` text by :func:`size_field_geo`
+and applied through the Gmsh API by :func:`apply_size_fields`.
+"""
+
+from dataclasses import dataclass
+from typing import Any
+
+from config import PCBParams
+from layout import Box, pcb_layout
+
+# Bounding boxes are grown by this much so entities lying on their faces are
+# still selected. It must stay well below the smallest feature size.
+BBOX_TOL = 1e-3
+
+
+@dataclass
+class SizeTarget:
+    """Entities of dimension ``dim`` inside ``boxes`` refined to ``size``."""
+
+    name: str
+    dim: int
+    boxes: list[Box]
+    size: float
+
+
+def _bbox(box: Box) -> Box:
+    """Turn an ``(x, y, z, dx, dy, dz)`` box into a grown bounding box."""
+    x, y, z, dx, dy, dz = box
+    return (
+        x - BBOX_TOL,
+        y - BBOX_TOL,
+        z - BBOX_TOL,
+        x + dx + BBOX_TOL,
+        y + dy + BBOX_TOL,
+        z + dz + BBOX_TOL,
+    )
+
+
+def build_size_targets(params: PCBParams) -> list[SizeTarget]:
+    """Return the refinement targets for the geometry in :func:`generate_geo`."""
+    layout = pcb_layout(params)
+    vias = [layout.main_via, *layout.guard_vias]
+    return [
+        SizeTarget("trace_curves", 1, [_bbox(layout.trace)], params.trace_edge_size),
+        SizeTarget("via_surfaces", 2, [_bbox(box) for box in vias], params.via_face_size),
+        SizeTarget("cut_curves", 1, [_bbox(layout.cut)], params.cut_edge_size),
+    ]
+
+
+_ENTITY_KEYWORD = {1: "Curve", 2: "Surface"}
+_DISTANCE_LIST = {1: "CurvesList", 2: "SurfacesList"}
+
+
+def _threshold_settings(params: PCBParams, target: SizeTarget) -> dict[str, float]:
+    return {
+        "SizeMin": target.size,
+        "SizeMax": params.mesh_size_max,
+        "DistMin": params.size_field_dist_min,
+        "DistMax": params.size_field_dist_max,
+    }
+
+
+def size_field_geo(params: PCBParams) -> str:
+    """Return the ``.geo`` statements defining the background size field."""
+    lines = []
+    thresholds = []
+    field = 1
+    for target in build_size_targets(params):
+        keyword = _ENTITY_KEYWORD[target.dim]
+        for i, box in enumerate(target.boxes):
+            op = "=" if i == 0 else "+="
+            coords = ", ".join(repr(float(c)) for c in box)
+            lines.append(f"{target.name}[] {op} {keyword} In BoundingBox{{ {coords} }};")
+        # Abort instead of silently dropping the refinement if the boxes drift
+        # away from the geometry.
+        lines.append(f"If (#{target.name}[] == 0)")
+        lines.append("  General.AbortOnError = 4;")
+        lines.append(f'  Error("Size field target {target.name} selected no entities");')
+        lines.append("  Abort;")
+        lines.append("EndIf")
+        lines.append(f"Field[{field}] = Distance;")
+        lines.append(f"Field[{field}].{_DISTANCE_LIST[target.dim]} = {{ {target.name}[] }};")
+        lines.append(f"Field[{field}].Sampling = {params.size_field_sampling:g};")
+        lines.append(f"Field[{field + 1}] = Threshold;")
+        lines.append(f"Field[{field + 1}].InField = {field};")
+        for name, value in _threshold_settings(params, target).items():
+            lines.append(f"Field[{field + 1}].{name} = {value:g};")
+        thresholds.append(str(field + 1))
+        field += 2
+    lines.append(f"Field[{field}] = Min;")
+    lines.append(f"Field[{field}].FieldsList = {{ {', '.join(thresholds)} }};")
+    lines.append(f"Background Field = {field};")
+    lines.append("Mesh.MeshSizeExtendFromBoundary = 0;")
+    lines.append("Mesh.MeshSizeFromPoints = 0;")
+    lines.append("Mesh.MeshSizeFromCurvature = 0;")
+    return "\n".join(lines)
+
+
+def apply_size_fields(gmsh: Any, params: PCBParams) -> None:
+    """Set up the size field of :func:`size_field_geo` on the current model."""
+    model = gmsh.model
+    thresholds = []
+    for target in build_size_targets(params):
+        tags: list[int] = []
+        for box in target.boxes:
+            for _, tag in model.getEntitiesInBoundingBox(*box, target.dim):
+                if tag not in tags:
+                    tags.append(tag)
+        if not tags:
+            raise RuntimeError(f"Size field target {target.name} selected no entities")
+        distance = model.mesh.field.add("Distance")
+        model.mesh.field.setNumbers(distance, _DISTANCE_LIST[target.dim], tags)
+        model.mesh.field.setNumber(distance, "Sampling", params.size_field_sampling)
+        threshold = model.mesh.field.add("Threshold")
+        model.mesh.field.setNumber(threshold, "InField", distance)
+        for name, value in _threshold_settings(params, target).items():
+            model.mesh.field.setNumber(threshold, name, value)
+        thresholds.append(threshold)
+    minimum = model.mesh.field.add("Min")
+    model.mesh.field.setNumbers(minimum, "FieldsList", thresholds)
+    model.mesh.field.setAsBackgroundMesh(minimum)
+    gmsh.option.setNumber("Mesh.MeshSizeExtendFromBoundary", 0)
+    gmsh.option.setNumber("Mesh.MeshSizeFromPoints", 0)
+    gmsh.option.setNumber("Mesh.MeshSizeFromCurvature", 0)
@@ -0,0 +1,145 @@
+"""Minimal stand-in for the Gmsh Python API used by the backend tests.
+
+Only the calls made by ``gmsh_backend`` and ``size_fields`` are provided.
+Geometry operations hand out fresh tags and mesh queries return fixed
+arrays; the calls that matter to the tests are recorded in ``state``.
+Writing a mesh named ``crash`` kills the process.
+"""
+
+import itertools
+import os
+from pathlib import Path
+
+NODE_TAGS = [1, 2, 3, 4]
+NODE_COORDS = [0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 1.0]
+ELEMENT_TYPES = [4]
+ELEMENT_TAGS = [[1]]
+ELEMENT_NODE_TAGS = [[1, 2, 3, 4]]
+
+state: dict = {}
+_tags = itertools.count(100)
+
+
+def _clear_model() -> None:
+    state.update(
+        models=[],
+        physical_groups={},
+        fields={},
+        background_field=None,
+        meshed=False,
+    )
+
+
+def reset() -> None:
+    """Forget everything recorded so far, including the call counters."""
+    _clear_model()
+    state.update(initialize_calls=0, clear_calls=0, options={})
+
+
+reset()
+
+
+def initialize(argv=None, readConfigFiles=True, run=False, interruptible=True) -> None:
+    state["initialize_calls"] += 1
+
+
+def finalize() -> None:
+    pass
+
+
+def clear() -> None:
+    state["clear_calls"] += 1
+    _clear_model()
+
+
+def write(file_name: str) -> None:
+    # Lets tests simulate a worker that dies in the middle of a job.
+    if Path(file_name).stem == "crash":
+        os._exit(1)
+    Path(file_name).write_text("fake mesh\n")
+
+
+class option:
+    @staticmethod
+    def setNumber(name: str, value: float) -> None:
+        state["options"][name] = value
+
+
+class model:
+    @staticmethod
+    def add(name: str) -> None:
+        state["models"].append(name)
+
+    @staticmethod
+    def addPhysicalGroup(dim: int, tags: list, tag: int = -1, name: str = "") -> int:
+        state["physical_groups"][(dim, tag)] = (name, list(tags))
+        return tag
+
+    @staticmethod
+    def getEntitiesInBoundingBox(xmin, ymin, zmin, xmax, ymax, zmax, dim=-1) -> list:
+        return [(dim, next(_tags))]
+
+    @staticmethod
+    def getBoundary(dimTags, combined=True, oriented=True, recursive=False) -> list:
+        return [(2, next(_tags))]
+
+    class occ:
+        @staticmethod
+        def addBox(x, y, z, dx, dy, dz, tag=-1) -> int:
+            return tag if tag >= 0 else next(_tags)
+
+        @staticmethod
+        def addSphere(xc, yc, zc, radius, tag=-1) -> int:
+            return tag if tag >= 0 else next(_tags)
+
+        @staticmethod
+        def cut(objectDimTags, toolDimTags, tag=-1, removeObject=True, removeTool=True):
+            return [(3, next(_tags))], []
+
+        @staticmethod
+        def fuse(objectDimTags, toolDimTags, tag=-1, removeObject=True, removeTool=True):
+            return [(3, next(_tags))], []
+
+        @staticmethod
+        def fragment(objectDimTags, toolDimTags, tag=-1, removeObject=True, removeTool=True):
+            return list(objectDimTags), [[dim_tag] for dim_tag in objectDimTags]
+
+        @staticmethod
+        def synchronize() -> None:
+            pass
+
+    class mesh:
+        @staticmethod
+        def generate(dim: int = 3) -> None:
+            state["meshed"] = True
+
+        @staticmethod
+        def getNodes():
+            return NODE_TAGS, NODE_COORDS, []
+
+        @staticmethod
+        def getElements():
+            return ELEMENT_TYPES, ELEMENT_TAGS, ELEMENT_NODE_TAGS
+
+        class field:
+            @staticmethod
+            def add(field_type: str, tag: int = -1) -> int:
+                tag = tag if tag >= 0 else len(state["fields"]) + 1
+                state["fields"][tag] = {"type": field_type}
+                return tag
+
+            @staticmethod
+            def setNumber(tag: int, option: str, value: float) -> None:
+                state["fields"][tag][option] = value
+
+            @staticmethod
+            def setNumbers(tag: int, option: str, values: list) -> None:
+                state["fields"][tag][option] = list(values)
+
+            @staticmethod
+            def setString(tag: int, option: str, value: str) -> None:
+                state["fields"][tag][option] = value
+
+            @staticmethod
+            def setAsBackgroundMesh(tag: int) -> None:
+                state["background_field"] = tag
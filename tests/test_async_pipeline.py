@@ -0,0 +1,163 @@
+import asyncio
+import os
+import time
+
+import pytest
+
+from utils import AsyncMeshPipeline, run_elmer_grid_async, run_gmsh_async
+
+pytestmark = pytest.mark.skipif(os.name != "posix", reason="fake executables are shell scripts")
+
+
+def _script(path, body):
+    path.write_text("#!/bin/sh\n" + body)
+    path.chmod(0o755)
+    return str(path)
+
+
+def _fake_gmsh(tmp_path, delay=0.0):
+    """Fake gmsh that logs start/end to ``runs.log`` and writes the mesh."""
+    log = tmp_path / "runs.log"
+    return _script(
+        tmp_path / "gmsh",
+        f'echo "start $1" >> {log}\n'
+        f'echo "meshing $1"\n'
+        f"sleep {delay}\n"
+        f'touch "$4"\n'
+        f'echo "end $1" >> {log}\n',
+    )
+
+
+def _geo(tmp_path, name):
+    path = tmp_path / f"{name}.geo"
+    path.write_text("")
+    return str(path)
+
+
+def _alive(pid):
+    try:
+        with open(f"/proc/{pid}/stat") as f:
+            return f.read().split(")")[-1].split()[0] != "Z"
+    except FileNotFoundError:
+        return False
+
+
+async def _wait_for_file(path, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not path.exists():
+        assert time.monotonic() < deadline, f"{path} was never written"
+        await asyncio.sleep(0.02)
+
+
+def test_run_gmsh_async_returns_mesh_and_streams_output(tmp_path):
+    gmsh = _fake_gmsh(tmp_path)
+    lines = []
+    mesh = asyncio.run(run_gmsh_async(_geo(tmp_path, "job"), str(tmp_path), gmsh, lines.append))
+    assert mesh == tmp_path / "job.unv"
+    assert mesh.exists()
+    assert lines == [f"meshing {tmp_path / 'job.geo'}"]
+
+
+def test_concurrency_limit(tmp_path):
+    gmsh = _fake_gmsh(tmp_path, delay=0.2)
+
+    async def main():
+        pipeline = AsyncMeshPipeline(max_concurrency=2, gmsh_path=gmsh)
+        tasks = [pipeline.submit(_geo(tmp_path, f"job{i}"), str(tmp_path)) for i in range(6)]
+        await asyncio.gather(*tasks)
+        await pipeline.close()
+
+    asyncio.run(main())
+
+    running = peak = 0
+    entries = (tmp_path / "runs.log").read_text().splitlines()
+    for entry in entries:
+        running += 1 if entry.startswith("start") else -1
+        peak = max(peak, running)
+    assert len(entries) == 12
+    assert peak == 2
+
+
+def test_cancel_running_job_kills_child(tmp_path):
+    pid_file = tmp_path / "pid"
+    # A launcher-style wrapper: the real work runs in a grandchild.
+    gmsh = _script(tmp_path / "gmsh", f"sleep 30 &\necho $! > {pid_file}\nwait\n")
+
+    async def main():
+        pipeline = AsyncMeshPipeline(max_concurrency=1, gmsh_path=gmsh)
+        task = pipeline.submit(_geo(tmp_path, "job"), str(tmp_path))
+        await _wait_for_file(pid_file)
+        start = time.monotonic()
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        await pipeline.close()
+        return time.monotonic() - start
+
+    assert asyncio.run(main()) < 5
+    pid = int(pid_file.read_text())
+    deadline = time.monotonic() + 5
+    while _alive(pid) and time.monotonic() < deadline:
+        time.sleep(0.05)
+    assert not _alive(pid)
+
+
+def test_cancel_queued_job_never_starts(tmp_path):
+    gmsh = _fake_gmsh(tmp_path, delay=30)
+
+    async def main():
+        pipeline = AsyncMeshPipeline(max_concurrency=1, gmsh_path=gmsh)
+        running = pipeline.submit(_geo(tmp_path, "running"), str(tmp_path))
+        queued = pipeline.submit(_geo(tmp_path, "queued"), str(tmp_path))
+        await _wait_for_file(tmp_path / "runs.log")
+        queued.cancel()
+        await asyncio.sleep(0.1)
+        running.cancel()
+        await pipeline.close()
+        return queued
+
+    queued = asyncio.run(main())
+    assert queued.cancelled()
+    assert (tmp_path / "runs.log").read_text().splitlines() == [f"start {tmp_path / 'running.geo'}"]
+
+
+def test_events_order_and_close(tmp_path):
+    gmsh = _fake_gmsh(tmp_path)
+    elmergrid = _script(tmp_path / "ElmerGrid", 'echo "converted $3"\n')
+
+    async def main():
+        pipeline = AsyncMeshPipeline(gmsh_path=gmsh, elmergrid_path=elmergrid)
+        events = []
+
+        async def collect():
+            async for event in pipeline.events():
+                events.append((event.job, event.kind, event.message))
+
+        collector = asyncio.create_task(collect())
+        await asyncio.sleep(0)
+        mesh, output = await pipeline.submit(_geo(tmp_path, "job"), str(tmp_path), elmergrid=True)
+        await pipeline.close()
+        await asyncio.wait_for(collector, 5)
+        return events, mesh, output
+
+    events, mesh, output = asyncio.run(main())
+    assert events == [
+        ("job", "stage", "queued"),
+        ("job", "stage", "gmsh"),
+        ("job", "log", f"meshing {tmp_path / 'job.geo'}"),
+        ("job", "stage", "elmergrid"),
+        ("job", "log", f"converted {mesh}"),
+        ("job", "stage", "done"),
+    ]
+    assert output == f"converted {mesh}"
+
+
+def test_elmergrid_failure_raises(tmp_path):
+    elmergrid = _script(tmp_path / "ElmerGrid", "echo boom\nexit 3\n")
+    with pytest.raises(RuntimeError, match="boom"):
+        asyncio.run(run_elmer_grid_async(str(tmp_path / "job.unv"), elmergrid))
+
+
+def test_invalid_concurrency():
+    with pytest.raises(ValueError):
+        AsyncMeshPipeline(max_concurrency=0)
@@ -0,0 +1,88 @@
+import pytest
+
+import fake_gmsh
+from config import PCBParams
+from gmsh_backend import GmshSession, GmshWorkerBackend, load_gmsh
+
+
+@pytest.fixture(autouse=True)
+def reset_fake_gmsh():
+    fake_gmsh.reset()
+
+def test_session_builds_model_and_reuses_gmsh(tmp_path):
+    session = GmshSession(fake_gmsh)
+    first = session.mesh(PCBParams(), tmp_path / "first.unv")
+    result = session.mesh(PCBParams(), tmp_path / "second.unv")
+    session.close()
+
+    state = fake_gmsh.state
+    assert state["initialize_calls"] == 1
+    assert state["clear_calls"] == 2
+    assert state["models"] == ["second"]
+    assert state["meshed"]
+
+    names = {name: tags for name, tags in state["physical_groups"].values()}
+    for name in ("Ground and Vias", "Trace", "Dielectric", "Air", "Ground Bottom", "Air Boundary"):
+        assert names[name]
+
+    fields = state["fields"]
+    assert [f["type"] for f in fields.values()].count("Threshold") == 3
+    assert fields[state["background_field"]]["type"] == "Min"
+    assert all(f.get("CurvesList") or f.get("SurfacesList") for f in fields.values() if f["type"] == "Distance")
+
+    assert first.mesh_path.read_text() == "fake mesh\n"
+    assert result.mesh_path == tmp_path / "second.unv"
+    assert result.node_tags == fake_gmsh.NODE_TAGS
+    assert result.element_node_tags == fake_gmsh.ELEMENT_NODE_TAGS
+
+
+def test_worker_round_trips_mesh_result(tmp_path):
+    with GmshWorkerBackend("fake_gmsh") as backend:
+        first = backend.mesh(PCBParams(), tmp_path / "a.unv")
+        pid = backend._process.pid
+        second = backend.mesh(PCBParams(trace_width=0.3), tmp_path / "b.unv")
+        assert backend._process.pid == pid
+
+    assert first.mesh_path.exists() and second.mesh_path.exists()
+    assert second.node_coords == fake_gmsh.NODE_COORDS
+    assert second.element_types == fake_gmsh.ELEMENT_TYPES
+    assert second.element_tags == fake_gmsh.ELEMENT_TAGS
+
+
+def test_worker_reports_missing_module(tmp_path):
+    with GmshWorkerBackend("no_such_gmsh_module") as backend:
+        with pytest.raises(RuntimeError, match="not installed"):
+            backend.mesh(PCBParams(), tmp_path / "a.unv")
+
+
+def test_load_gmsh_missing_module():
+    with pytest.raises(RuntimeError):
+        load_gmsh("no_such_gmsh_module")
+
+
+def test_worker_crash_is_reaped(tmp_path):
+    with GmshWorkerBackend("fake_gmsh") as backend:
+        backend.mesh(PCBParams(), tmp_path / "a.unv")
+        crashed = backend._process
+        conn = backend._conn
+
+        with pytest.raises(RuntimeError, match="exited unexpectedly"):
+            backend.mesh(PCBParams(), tmp_path / "crash.unv")
+        assert backend._process is None
+        assert conn.closed
+        assert crashed.exitcode == 1
+
+        assert backend.mesh(PCBParams(), tmp_path / "b.unv").mesh_path.exists()
+
+
+def test_dead_worker_is_replaced(tmp_path):
+    with GmshWorkerBackend("fake_gmsh") as backend:
+        backend.mesh(PCBParams(), tmp_path / "a.unv")
+        dead = backend._process
+        conn = backend._conn
+        dead.kill()
+        dead.join()
+
+        assert backend.mesh(PCBParams(), tmp_path / "b.unv").mesh_path.exists()
+        assert backend._process is not dead
+        assert conn.closed
@@ -0,0 +1,93 @@
+import re
+
+import pytest
+
+import fake_gmsh
+from config import PCBParams
+from gmsh_generator import generate_geo
+from size_fields import BBOX_TOL, apply_size_fields, build_size_targets, size_field_geo
+
+
+def _fields(geo):
+    """Parse ``Field[n] = Type;`` / ``Field[n].Option = value;`` lines."""
+    fields = {}
+    for tag, option, value in re.findall(r"^Field\[(\d+)\](?:\.(\w+))? = (.+);$", geo, re.M):
+        field = fields.setdefault(int(tag), {})
+        field[option or "type"] = value
+    return fields
+
+
+def _targets(params):
+    return {target.name: target for target in build_size_targets(params)}
+
+
+def test_seed_points_are_gone():
+    geo = generate_geo(PCBParams())
+    assert "Point(200)" not in geo
+    assert "MathEval" not in geo
+    assert size_field_geo(PCBParams()) in geo
+
+
+def test_distance_fields_and_background():
+    geo = size_field_geo(PCBParams())
+    fields = _fields(geo)
+
+    distances = {tag: f for tag, f in fields.items() if f["type"] == "Distance"}
+    assert distances[1]["CurvesList"] == "{ trace_curves[] }"
+    assert distances[3]["SurfacesList"] == "{ via_surfaces[] }"
+    assert distances[5]["CurvesList"] == "{ cut_curves[] }"
+
+    thresholds = [tag for tag, f in fields.items() if f["type"] == "Threshold"]
+    assert [int(fields[tag]["InField"]) for tag in thresholds] == sorted(distances)
+
+    background = int(re.search(r"^Background Field = (\d+);$", geo, re.M).group(1))
+    assert fields[background]["type"] == "Min"
+    assert fields[background]["FieldsList"] == "{ " + ", ".join(map(str, thresholds)) + " }"
+
+
+def test_params_feed_threshold_and_distance_values():
+    params = PCBParams(
+        trace_edge_size=0.011,
+        via_face_size=0.022,
+        cut_edge_size=0.033,
+        size_field_dist_min=0.07,
+        size_field_dist_max=3.5,
+        size_field_sampling=123,
+        mesh_size_max=1.5,
+    )
+    fields = _fields(size_field_geo(params))
+
+    for distance, threshold, size in ((1, 2, 0.011), (3, 4, 0.022), (5, 6, 0.033)):
+        assert float(fields[distance]["Sampling"]) == 123
+        assert float(fields[threshold]["SizeMin"]) == size
+        assert float(fields[threshold]["SizeMax"]) == 1.5
+        assert float(fields[threshold]["DistMin"]) == 0.07
+        assert float(fields[threshold]["DistMax"]) == 3.5
+
+
+def test_bounding_boxes_follow_geometry():
+    base = _targets(PCBParams())
+    longer = _targets(PCBParams(trace_length=8.0))
+    trace_x_max = base["trace_curves"].boxes[0][3]
+    assert longer["trace_curves"].boxes[0][3] == pytest.approx(trace_x_max - 1.8)
+
+    (x0, _, _, x1, _, _), = _targets(PCBParams(cut_width=2.0))["cut_curves"].boxes
+    assert x1 - x0 == pytest.approx(2.0 + 2 * BBOX_TOL)
+
+    guard = _targets(PCBParams(guard_via_width=0.3))["via_surfaces"].boxes[1]
+    assert guard[3] - guard[0] == pytest.approx(0.3 + 2 * BBOX_TOL)
+    assert guard[4] - guard[1] == pytest.approx(0.3 + 2 * BBOX_TOL)
+    assert len(base["via_surfaces"].boxes) == 5
+
+
+def test_empty_selection_is_an_error(monkeypatch):
+    monkeypatch.setattr(fake_gmsh.model, "getEntitiesInBoundingBox", staticmethod(lambda *a: []))
+    with pytest.raises(RuntimeError, match="trace_curves selected no entities"):
+        apply_size_fields(fake_gmsh, PCBParams())
+
+
+def test_geo_aborts_on_empty_selection():
+    geo = size_field_geo(PCBParams())
+    for name in ("trace_curves", "via_surfaces", "cut_curves"):
+        assert f"If (#{name}[] == 0)" in geo
+    assert geo.count("Abort;") == 3
@@ -1,12 +1,25 @@
+import asyncio
 import os
 import platform
+import signal
 import subprocess
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
+from typing import AsyncIterator, Callable, Iterator, Optional
 
 CONFIG_PATH = os.path.join(os.path.expanduser("~"), ".pcb_gmsh_gui")
 ELMER_CONFIG_PATH = os.path.join(os.path.expanduser("~"), ".pcb_elmer_gui")
 
+WINDOWS_GMSH_PATHS = [
+    r"E:\\Gmsh\\gmsh-4.13.1-Windows64\\gmsh-4.13.1-Windows64",
+    r"C:\\Program Files (x86)\\Gmsh\\gmsh.exe",
+    os.path.expanduser(r"~\\AppData\\Local\\Gmsh\\gmsh.exe"),
+]
+WINDOWS_ELMER_PATHS = [
+    os.path.expanduser(r"~\\AppData\\Local\\Elmer\\bin\\ElmerGrid.exe"),
+    r"C:\\Program Files\\Elmer\\bin\\ElmerGrid.exe",
+]
+
 
 def load_last_gmsh_path() -> Optional[str]:
     """Return the previously saved Gmsh executable path if available."""
@@ -81,12 +94,7 @@ def run_gmsh_batch(file_path: str, gmsh_path: Optional[str] = None) -> None:
             pass
 
         if platform.system() == "Windows":
-            gmsh_exe_paths = [
-                r"E:\\Gmsh\\gmsh-4.13.1-Windows64\\gmsh-4.13.1-Windows64",
-                r"C:\\Program Files (x86)\\Gmsh\\gmsh.exe",
-                os.path.expanduser(r"~\\AppData\\Local\\Gmsh\\gmsh.exe"),
-            ]
-            for gmsh_path in gmsh_exe_paths:
+            for gmsh_path in WINDOWS_GMSH_PATHS:
                 if os.path.exists(gmsh_path):
                     subprocess.run([gmsh_path, file_path, "-nopopup", "-"], check=True)
                     return
@@ -127,12 +135,7 @@ def run_gmsh(geo_file: str, output_dir: str, gmsh_path: Optional[str] = None) ->
         return output_path
 
     if platform.system() == "Windows":
-        gmsh_exe_paths = [
-            r"E:\\Gmsh\\gmsh-4.13.1-Windows64\\gmsh-4.13.1-Windows64",
-            r"C:\\Program Files (x86)\\Gmsh\\gmsh.exe",
-            os.path.expanduser(r"~\\AppData\\Local\\Gmsh\\gmsh.exe"),
-        ]
-        for exe in gmsh_exe_paths:
+        for exe in WINDOWS_GMSH_PATHS:
             if os.path.exists(exe) and _attempt(exe):
                 return output_path
 
@@ -169,14 +172,231 @@ def run_elmer_grid(unv_file: str, elmergrid_path: Optional[str] = None) -> str:
             return result
 
     if platform.system() == "Windows":
-        elmer_paths = [
-            os.path.expanduser(r"~\\AppData\\Local\\Elmer\\bin\\ElmerGrid.exe"),
-            r"C:\\Program Files\\Elmer\\bin\\ElmerGrid.exe",
-        ]
-        for exe in elmer_paths:
+        for exe in WINDOWS_ELMER_PATHS:
             if os.path.exists(exe):
                 result = _attempt(exe)
                 if result is not None:
                     return result
 
     raise RuntimeError("Could not run ElmerGrid")
+
+
+# ---------------------------------------------------------------------------
+# asyncio API
+# ---------------------------------------------------------------------------
+
+LineCallback = Callable[[str], None]
+
+
+def _candidate_executables(
+    preferred: Optional[str], names: tuple[str, ...], windows_paths: list[str]
+) -> Iterator[str]:
+    """Yield executables in the same order the blocking runners try them."""
+    if preferred:
+        yield preferred
+    yield from names
+    if platform.system() == "Windows":
+        for exe in windows_paths:
+            if os.path.exists(exe):
+                yield exe
+
+
+# Seconds to wait for a killed child before giving up on reaping it.
+KILL_WAIT_TIMEOUT = 5.0
+
+
+def _kill_process_tree(proc: asyncio.subprocess.Process) -> None:
+    """Kill ``proc`` and, on POSIX, every process in its session."""
+    try:
+        if os.name == "posix":
+            os.killpg(proc.pid, signal.SIGKILL)
+        else:
+            proc.kill()
+    except ProcessLookupError:
+        pass
+
+
+async def _exec_async(args: list[str], on_line: Optional[LineCallback] = None) -> tuple[int, str]:
+    """Run ``args`` and return ``(returncode, output)``.
+
+    Stdout and stderr are merged and forwarded line by line to ``on_line``.
+    If the awaiting task is cancelled the child and anything it spawned (for
+    instance when ``gmsh`` is a launcher script) is killed before the
+    cancellation propagates.
+    """
+    proc = await asyncio.create_subprocess_exec(
+        *args,
+        stdin=asyncio.subprocess.DEVNULL,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.STDOUT,
+        start_new_session=os.name == "posix",
+    )
+    lines: list[str] = []
+    try:
+        assert proc.stdout is not None
+        async for raw in proc.stdout:
+            line = raw.decode(errors="replace").rstrip("\r\n")
+            lines.append(line)
+            if on_line is not None:
+                on_line(line)
+        returncode = await proc.wait()
+    except BaseException:
+        # Kill the whole group even if the child itself has exited: a
+        # grandchild still holding the pipe would otherwise block wait().
+        _kill_process_tree(proc)
+        try:
+            await asyncio.wait_for(proc.wait(), KILL_WAIT_TIMEOUT)
+        except asyncio.TimeoutError:
+            pass
+        raise
+    return returncode, "\n".join(lines)
+
+
+async def run_gmsh_async(
+    geo_file: str,
+    output_dir: str,
+    gmsh_path: Optional[str] = None,
+    on_line: Optional[LineCallback] = None,
+) -> Path:
+    """Async counterpart of :func:`run_gmsh`."""
+
+    base_name = Path(geo_file).stem
+    output_path = Path(output_dir) / f"{base_name}.unv"
+
+    args = [geo_file, "-3", "-o", str(output_path), "-format", "unv"]
+
+    for exe in _candidate_executables(gmsh_path, ("gmsh",), WINDOWS_GMSH_PATHS):
+        try:
+            await _exec_async([exe, *args], on_line)
+        except (FileNotFoundError, PermissionError):
+            continue
+        # As with ``run_gmsh`` a non-zero exit code is tolerated as long as
+        # the mesh file has been written.
+        if output_path.exists():
+            return output_path
+
+    raise RuntimeError("Could not run Gmsh")
+
+
+async def run_elmer_grid_async(
+    unv_file: str,
+    elmergrid_path: Optional[str] = None,
+    on_line: Optional[LineCallback] = None,
+) -> str:
+    """Async counterpart of :func:`run_elmer_grid`."""
+
+    names = ("ElmerGrid", "elmergrid")
+    for exe in _candidate_executables(elmergrid_path, names, WINDOWS_ELMER_PATHS):
+        try:
+            returncode, output = await _exec_async([exe, "8", "2", unv_file, "-autoclean"], on_line)
+        except (FileNotFoundError, PermissionError):
+            continue
+        if returncode != 0:
+            raise RuntimeError(output.strip() or f"{exe} exited with code {returncode}")
+        return output
+
+    raise RuntimeError("Could not run ElmerGrid")
+
+
+@dataclass
+class PipelineEvent:
+    """A log line or stage transition emitted by :class:`AsyncMeshPipeline`.
+
+    ``kind`` is ``"stage"`` or ``"log"``. For stage events ``message`` is one
+    of ``queued``, ``gmsh``, ``elmergrid``, ``done``, ``failed`` or
+    ``cancelled``; for log events it is a line of tool output.
+    """
+
+    job: str
+    kind: str
+    message: str
+
+
+_EVENTS_CLOSED = object()
+
+
+class AsyncMeshPipeline:
+    """Run Gmsh (and optionally ElmerGrid) jobs concurrently on one event loop.
+
+    At most ``max_concurrency`` child processes run at a time; further jobs
+    wait on a semaphore, so queuing thousands of jobs costs one task each and
+    no threads. Cancelling a job's task kills its running child process.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = 4,
+        gmsh_path: Optional[str] = None,
+        elmergrid_path: Optional[str] = None,
+    ) -> None:
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        self.gmsh_path = gmsh_path
+        self.elmergrid_path = elmergrid_path
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._tasks: set[asyncio.Task] = set()
+        self._listeners: list[asyncio.Queue] = []
+
+    def _emit(self, job: str, kind: str, message: str) -> None:
+        event = PipelineEvent(job, kind, message)
+        for queue in self._listeners:
+            queue.put_nowait(event)
+
+    async def run_job(
+        self, geo_file: str, output_dir: str, elmergrid: bool = False
+    ) -> tuple[Path, Optional[str]]:
+        """Mesh ``geo_file`` and return the ``.unv`` path and ElmerGrid output."""
+
+        job = Path(geo_file).stem
+
+        def log(line: str) -> None:
+            self._emit(job, "log", line)
+
+        self._emit(job, "stage", "queued")
+        try:
+            async with self._semaphore:
+                self._emit(job, "stage", "gmsh")
+                mesh_path = await run_gmsh_async(geo_file, output_dir, self.gmsh_path, log)
+                output = None
+                if elmergrid:
+                    self._emit(job, "stage", "elmergrid")
+                    output = await run_elmer_grid_async(str(mesh_path), self.elmergrid_path, log)
+        except asyncio.CancelledError:
+            self._emit(job, "stage", "cancelled")
+            raise
+        except Exception as exc:
+            self._emit(job, "stage", "failed")
+            log(str(exc))
+            raise
+        self._emit(job, "stage", "done")
+        return mesh_path, output
+
+    def submit(self, geo_file: str, output_dir: str, elmergrid: bool = False) -> asyncio.Task:
+        """Schedule :meth:`run_job` and return its task (cancel it to abort)."""
+        task = asyncio.ensure_future(self.run_job(geo_file, output_dir, elmergrid))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
+    async def events(self) -> AsyncIterator[PipelineEvent]:
+        """Yield events emitted from now until :meth:`close` is called."""
+        queue: asyncio.Queue = asyncio.Queue()
+        self._listeners.append(queue)
+        try:
+            while True:
+                event = await queue.get()
+                if event is _EVENTS_CLOSED:
+                    return
+                yield event
+        finally:
+            self._listeners.remove(queue)
+
+    async def close(self, cancel: bool = False) -> None:
+        """Wait for (or cancel) submitted jobs and end all event iterators."""
+        tasks = list(self._tasks)
+        if cancel:
+            for task in tasks:
+                task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        for queue in self._listeners:
+            queue.put_nowait(_EVENTS_CLOSED)